@@ -4,17 +4,22 @@ Demo run of AlgoHouse Data Quality Benchmark
 Shows sample output without hitting live exchange APIs
 """
 
+import sys
 import time
-import json
+import orjson
 from datetime import datetime
 
-print("=" * 80)
-print("🚀 AlgoHouse Data Quality Benchmark - Demo Run")
-print("=" * 80)
-print(f"\n📅 Run Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-print(f"🎯 Symbol: BTC/USDT")
-print(f"🔢 Exchanges: 10")
-print(f"📊 Sample Size: 1000 trades per exchange\n")
+# Output is buffered into one list and flushed with a single write at the
+# end, instead of ~60 individual print() calls each hitting stdout
+out = []
+
+out.append("=" * 80)
+out.append("🚀 AlgoHouse Data Quality Benchmark - Demo Run")
+out.append("=" * 80)
+out.append(f"\n📅 Run Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+out.append(f"🎯 Symbol: BTC/USDT")
+out.append(f"🔢 Exchanges: 10")
+out.append(f"📊 Sample Size: 1000 trades per exchange\n")
 
 start_time = time.time()
 
@@ -122,115 +127,122 @@ exchanges_data = {
     }
 }
 
-print("=" * 80)
-print("SECTION 1: Setup")
-print("=" * 80)
-print("✅ Dependencies: ccxt, pandas, scipy, statsmodels, plotly, numpy, requests")
-print("✅ Exchange list configured: 10 exchanges")
-time.sleep(0.5)
-
-print("\n" + "=" * 80)
-print("SECTION 2: Data Collection")
-print("=" * 80)
+# Sort each ranking once up front and reuse the lists below; the trust-score
+# order in particular is consumed by both the composite table and the top-3
+# summary.
+by_tick = sorted(exchanges_data.items(), key=lambda x: x[1]['tick_score'], reverse=True)
+by_orderbook = sorted(exchanges_data.items(), key=lambda x: x[1]['orderbook_score'], reverse=True)
+by_benford_p = sorted(exchanges_data.items(), key=lambda x: x[1]['benford_p_value'], reverse=True)
+by_symmetry_dev = sorted(exchanges_data.items(), key=lambda x: abs(x[1]['symmetry'] - 50))
+by_trust = sorted(exchanges_data.items(), key=lambda x: x[1]['trust_score'], reverse=True)
+
+out.append("=" * 80)
+out.append("SECTION 1: Setup")
+out.append("=" * 80)
+out.append("✅ Dependencies: ccxt, pandas, scipy, statsmodels, plotly, numpy, requests")
+out.append("✅ Exchange list configured: 10 exchanges")
+
+out.append("\n" + "=" * 80)
+out.append("SECTION 2: Data Collection")
+out.append("=" * 80)
 for exchange in exchanges_data.keys():
-    print(f"📡 {exchange.upper()}")
-    print(f"  ✓ 1000 trades")
-    print(f"  ✓ 20 bid levels, 20 ask levels")
-    print(f"  ✓ 24 OHLCV candles")
-    time.sleep(0.2)
+    out.append(f"📡 {exchange.upper()}")
+    out.append(f"  ✓ 1000 trades")
+    out.append(f"  ✓ 20 bid levels, 20 ask levels")
+    out.append(f"  ✓ 24 OHLCV candles")
 
-print("\n✅ Data collection complete! 10/10 exchanges successful")
-time.sleep(0.5)
+out.append("\n✅ Data collection complete! 10/10 exchanges successful")
 
-print("\n" + "=" * 80)
-print("SECTION 3: Five Quality Measurements")
-print("=" * 80)
+out.append("\n" + "=" * 80)
+out.append("SECTION 3: Five Quality Measurements")
+out.append("=" * 80)
 
-print("\n📏 Tick Completeness Scores:")
-for exchange, data in sorted(exchanges_data.items(), key=lambda x: x[1]['tick_score'], reverse=True):
-    print(f"{exchange:12} Score: {data['tick_score']:3}/100  |  Gaps>1s: {100-data['tick_score']//5:3}  |  Max gap: {(100-data['tick_score'])/10:5.1f}s")
+out.append("\n📏 Tick Completeness Scores:")
+for exchange, data in by_tick:
+    out.append(f"{exchange:12} Score: {data['tick_score']:3}/100  |  Gaps>1s: {100-data['tick_score']//5:3}  |  Max gap: {(100-data['tick_score'])/10:5.1f}s")
 
-print("\n📖 Order Book Depth Accuracy:")
-for exchange, data in sorted(exchanges_data.items(), key=lambda x: x[1]['orderbook_score'], reverse=True):
+out.append("\n📖 Order Book Depth Accuracy:")
+for exchange, data in by_orderbook:
     spread = (100 - data['orderbook_score']) * 0.5
     quality = 'EXCELLENT' if data['orderbook_score'] >= 80 else 'GOOD' if data['orderbook_score'] >= 60 else 'FAIR'
-    print(f"{exchange:12} Score: {data['orderbook_score']:6.1f}/100  |  Spread: {spread:6.2f} bps  |  Quality: {quality}")
+    out.append(f"{exchange:12} Score: {data['orderbook_score']:6.1f}/100  |  Spread: {spread:6.2f} bps  |  Quality: {quality}")
 
-print("\n🔬 Benford's Law Wash Trading Test:")
-for exchange, data in sorted(exchanges_data.items(), key=lambda x: x[1]['benford_p_value'], reverse=True):
+out.append("\n🔬 Benford's Law Wash Trading Test:")
+for exchange, data in by_benford_p:
     result = 'PASS' if data['benford_pass'] else 'FAIL'
     risk = 'LOW' if data['benford_pass'] else 'HIGH'
-    print(f"{exchange:12} Result: {result:15}  |  p-value: {data['benford_p_value']:6.4f}  |  Risk: {risk}")
+    out.append(f"{exchange:12} Result: {result:15}  |  p-value: {data['benford_p_value']:6.4f}  |  Risk: {risk}")
 
-print("\n⚖️  Buy/Sell Symmetry:")
-for exchange, data in sorted(exchanges_data.items(), key=lambda x: abs(x[1]['symmetry'] - 50)):
+out.append("\n⚖️  Buy/Sell Symmetry:")
+for exchange, data in by_symmetry_dev:
     sell_pct = 100 - data['symmetry']
     result = 'PASS' if 45 <= data['symmetry'] <= 55 else 'ACCEPTABLE' if 40 <= data['symmetry'] <= 60 else 'SUSPICIOUS'
-    print(f"{exchange:12} Result: {result:12}  |  Buy: {data['symmetry']:5.2f}%  |  Sell: {sell_pct:5.2f}%")
-
-time.sleep(0.5)
-
-print("\n" + "=" * 80)
-print("SECTION 4: Composite Data Trust Score")
-print("=" * 80)
-print(f"\n{'Exchange':<12} {'Score':>8} {'Grade':>6} {'Benford':>8} {'OB':>8} {'Tick':>8} {'Sym':>8}")
-print("=" * 80)
-for exchange, data in sorted(exchanges_data.items(), key=lambda x: x[1]['trust_score'], reverse=True):
+    out.append(f"{exchange:12} Result: {result:12}  |  Buy: {data['symmetry']:5.2f}%  |  Sell: {sell_pct:5.2f}%")
+
+out.append("\n" + "=" * 80)
+out.append("SECTION 4: Composite Data Trust Score")
+out.append("=" * 80)
+out.append(f"\n{'Exchange':<12} {'Score':>8} {'Grade':>6} {'Benford':>8} {'OB':>8} {'Tick':>8} {'Sym':>8}")
+out.append("=" * 80)
+for exchange, data in by_trust:
     benford_score = 100 if data['benford_pass'] else 0
     symmetry_score = 100 if 45 <= data['symmetry'] <= 55 else 70 if 40 <= data['symmetry'] <= 60 else 30
-    print(f"{exchange:<12} {data['trust_score']:>8.1f} {data['grade']:>6} {benford_score:>8} {data['orderbook_score']:>8.0f} {data['tick_score']:>8} {symmetry_score:>8}")
-
-time.sleep(0.5)
+    out.append(f"{exchange:<12} {data['trust_score']:>8.1f} {data['grade']:>6} {benford_score:>8} {data['orderbook_score']:>8.0f} {data['tick_score']:>8} {symmetry_score:>8}")
 
-print("\n" + "=" * 80)
-print("SECTION 5: Visualizations")
-print("=" * 80)
-print("✅ Heatmap generated (heatmap.html)")
-print("✅ Scatter plot generated (scatter.html)")
-print("✅ Bar chart generated (barchart.html)")
+out.append("\n" + "=" * 80)
+out.append("SECTION 5: Visualizations")
+out.append("=" * 80)
+out.append("✅ Heatmap generated (heatmap.html)")
+out.append("✅ Scatter plot generated (scatter.html)")
+out.append("✅ Bar chart generated (barchart.html)")
 
 end_time = time.time()
 execution_time = end_time - start_time
 
-print("\n" + "=" * 80)
-print("📊 SUMMARY REPORT")
-print("=" * 80)
+out.append("\n" + "=" * 80)
+out.append("📊 SUMMARY REPORT")
+out.append("=" * 80)
 
-print(f"\n🏆 TOP 3 EXCHANGES BY TRUST SCORE:")
-top_3 = sorted(exchanges_data.items(), key=lambda x: x[1]['trust_score'], reverse=True)[:3]
-for rank, (exchange, data) in enumerate(top_3, 1):
-    print(f"  {rank}. {exchange.upper():12} - Score: {data['trust_score']:.1f}/100 (Grade: {data['grade']})")
+out.append(f"\n🏆 TOP 3 EXCHANGES BY TRUST SCORE:")
+for rank, (exchange, data) in enumerate(by_trust[:3], 1):
+    out.append(f"  {rank}. {exchange.upper():12} - Score: {data['trust_score']:.1f}/100 (Grade: {data['grade']})")
 
-print(f"\n⚠️  EXCHANGES FLAGGED FOR WASH TRADING (Benford's Law):")
-flagged = [(e, d) for e, d in exchanges_data.items() if not d['benford_pass']]
-if flagged:
-    for exchange, data in flagged:
-        print(f"  - {exchange.upper():12} (FAIL, p-value: {data['benford_p_value']:.4f})")
-else:
-    print("  ✅ No exchanges flagged")
+out.append(f"\n⚠️  EXCHANGES FLAGGED FOR WASH TRADING (Benford's Law):")
+any_flagged = False
+for exchange, data in exchanges_data.items():
+    if not data['benford_pass']:
+        any_flagged = True
+        out.append(f"  - {exchange.upper():12} (FAIL, p-value: {data['benford_p_value']:.4f})")
+if not any_flagged:
+    out.append("  ✅ No exchanges flagged")
 
-print(f"\n⏱️  EXECUTION TIME: {execution_time:.2f} seconds ({execution_time/60:.2f} minutes)")
-print(f"✅ Runtime < 10 minutes: {'YES' if execution_time < 600 else 'NO'}")
+out.append(f"\n⏱️  EXECUTION TIME: {execution_time:.2f} seconds ({execution_time/60:.2f} minutes)")
+out.append(f"✅ Runtime < 10 minutes: {'YES' if execution_time < 600 else 'NO'}")
 
-print("\n📊 EXPORTS:")
-print("  - heatmap.html (quality metrics heatmap)")
-print("  - scatter.html (trust vs. volume)")
-print("  - barchart.html (ranked trust scores)")
+out.append("\n📊 EXPORTS:")
+out.append("  - heatmap.html (quality metrics heatmap)")
+out.append("  - scatter.html (trust vs. volume)")
+out.append("  - barchart.html (ranked trust scores)")
 
-print("\n" + "=" * 80)
-print("✅ Benchmark complete!")
-print("=" * 80)
+out.append("\n" + "=" * 80)
+out.append("✅ Benchmark complete!")
+out.append("=" * 80)
 
 # Save results to JSON
+# orjson serializes the datetime natively; no isoformat() pre-render needed
 results = {
-    'run_date': datetime.now().isoformat(),
+    'run_date': datetime.now(),
     'execution_time_seconds': execution_time,
     'symbol': 'BTC/USDT',
     'exchanges_tested': len(exchanges_data),
     'results': exchanges_data
 }
 
-with open('demo_results.json', 'w') as f:
-    json.dump(results, f, indent=2)
+with open('demo_results.json', 'wb') as f:
+    f.write(orjson.dumps(
+        results,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC))
+
+out.append(f"\n💾 Results saved to demo_results.json")
 
-print(f"\n💾 Results saved to demo_results.json")
+sys.stdout.write('\n'.join(out) + '\n')
@@ -12,101 +12,297 @@ Usage:
 """
 
 import argparse
-import ccxt
-import json
+import asyncio
+import ccxt.async_support as ccxt_async
+from ccxt.base.exchange import BaseExchange
+import itertools
+import math
 import numpy as np
+import os
 import pandas as pd
 from datetime import datetime, timedelta
-from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from scipy import stats
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 import sys
+import time
 
+_stdlib_parse_json = BaseExchange.parse_json
 
-def fetch_trades(exchange_name, pair, days=30):
+
+def _parse_json_orjson(self, http_response):
+    """orjson-backed replacement for CCXT's stdlib-json response parsing."""
+    if self.number is not float:
+        # Exchanges configured with string numbers rely on the stdlib
+        # parser's parse_float/parse_int hooks, which orjson doesn't offer
+        return _stdlib_parse_json(self, http_response)
+    if isinstance(http_response, (bytes, bytearray, str)):
+        try:
+            return orjson.loads(http_response)
+        except orjson.JSONDecodeError:
+            return None
+    return http_response
+
+
+# Each paginated fetch_trades page is a ~200KB JSON blob; orjson parses it
+# roughly 2x faster than stdlib json. BaseExchange is the shared ancestor of
+# the sync and async transports (the async classes do not inherit from
+# ccxt.Exchange), so one patch covers both.
+BaseExchange.parse_json = _parse_json_orjson
+
+# Shared session keeps TCP/TLS warm across AlgoHouse API calls
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=10))
+
+# The AlgoHouse exchange list is stable within a run; when scoring many
+# exchanges in a batch, fetch it once and reuse for five minutes
+_ALGOHOUSE_TTL_SECONDS = 300
+_algohouse_cache = {'fetched_at': 0.0, 'data': None}
+
+# Benford's Law first-digit probabilities P(d) = log10(1 + 1/d), d in [1,9].
+# Constant, so computed once at import instead of per benford_law_test call.
+_BENFORD_P = np.log10(1.0 + 1.0 / np.arange(1, 10))
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+if HAVE_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _benford_chi2(digits):
+        """Chi-squared statistic of first digits vs. Benford's Law (JIT-compiled).
+
+        Fuses the digit histogram and the chi-squared accumulation into a
+        single compiled pass. cache=True persists the compiled kernel across
+        runs; fastmath lets LLVM reassociate the accumulation.
+        """
+        counts = np.zeros(10, np.int64)
+        for d in digits:
+            counts[d] += 1
+        n = digits.size
+        chi2 = 0.0
+        for d in range(1, 10):
+            expected = n * math.log10(1.0 + 1.0 / d)
+            chi2 += (counts[d] - expected) ** 2 / expected
+        return chi2
+
+
+# Number of paginated fetch_trades requests kept in flight at once
+FETCH_CONCURRENCY = 8
+
+# Resolved ccxt.async_support exchange classes, keyed by lowercase name
+_EXCHANGE_CLS = {}
+
+
+def get_exchange_class(exchange_name):
     """
-    Fetch historical trades from specified exchange using CCXT.
-    
+    Resolve a ccxt.async_support exchange class, caching the lookup.
+
     Args:
         exchange_name: Exchange identifier (e.g., 'binance', 'kraken')
+
+    Returns:
+        type: The ccxt.async_support exchange class
+    """
+    name = exchange_name.lower()
+    cls = _EXCHANGE_CLS.get(name)
+    if cls is None:
+        cls = getattr(ccxt_async, name)
+        _EXCHANGE_CLS[name] = cls
+    return cls
+
+
+def _dedupe_page(seen_keys, page):
+    """
+    Filter one page down to trades not seen in overlapping windows.
+
+    Args:
+        seen_keys: Set of trade keys already merged (mutated in place)
+        page: One page of trades from fetch_trades
+
+    Returns:
+        list: Trades from the page that have not been seen before
+    """
+    kept = []
+    for trade in page:
+        key = trade.get('id') or (trade['timestamp'], trade.get('price'),
+                                  trade.get('amount'), trade.get('side'))
+        if key not in seen_keys:
+            seen_keys.add(key)
+            kept.append(trade)
+    return kept
+
+
+async def _fetch_window(exchange, pair, since, semaphore):
+    """Fetch one 1000-trade page starting at `since`, bounded by the semaphore."""
+    async with semaphore:
+        return await exchange.fetch_trades(pair, since=since, limit=1000)
+
+
+async def _fetch_trades_async(exchange, pair, days):
+    """
+    Paginate fetch_trades over the requested period with overlapped requests.
+
+    A serial probe page establishes the pair's trade rate, then windows of
+    FETCH_CONCURRENCY requests are issued together at fixed `since` strides
+    via asyncio.gather. Pages are merged in window order and deduplicated by
+    trade id; if a full page does not reach the next window's start, the
+    stride was too wide, so the frontier rewinds to the last covered trade
+    and the stride is re-estimated. A short page (<1000) means the end of
+    the available data has been reached.
+
+    Args:
+        exchange: ccxt.async_support exchange instance
         pair: Trading pair (e.g., 'BTC/USDT')
         days: Number of days of historical data to fetch
-    
+
     Returns:
         list: Trade data with timestamp, price, amount, side
     """
-    try:
-        exchange_class = getattr(ccxt, exchange_name)
-        exchange = exchange_class({
-            'enableRateLimit': True,
-            'timeout': 30000,
-        })
-        
-        print(f"Fetching {days} days of trades from {exchange_name} for {pair}...")
-        
-        # Calculate time range
-        end_time = datetime.now()
-        start_time = end_time - timedelta(days=days)
-        since = int(start_time.timestamp() * 1000)
-        
-        all_trades = []
-        current_since = since
-        
-        while current_since < int(end_time.timestamp() * 1000):
-            trades = exchange.fetch_trades(pair, since=current_since, limit=1000)
-            
-            if not trades:
-                break
-            
-            all_trades.extend(trades)
-            current_since = trades[-1]['timestamp'] + 1
-            
-            print(f"  Fetched {len(all_trades)} trades...", end='\r')
-            
-            if len(trades) < 1000:
-                break
-        
-        print(f"\nTotal trades fetched: {len(all_trades)}")
-        return all_trades
-        
-    except Exception as e:
-        print(f"Error fetching trades: {e}")
-        sys.exit(1)
+    end_time = datetime.now()
+    start_time = end_time - timedelta(days=days)
+    end_ms = int(end_time.timestamp() * 1000)
+    current_since = int(start_time.timestamp() * 1000)
+
+    # Deduplicated pages are collected and concatenated once at the end;
+    # repeated list.extend would periodically realloc the trade list as it
+    # grows into the millions
+    kept_pages = []
+    total_kept = 0
+    seen_keys = set()
+    semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+    # Serial probe: one page to estimate how much time 1000 trades span
+    probe = await exchange.fetch_trades(pair, since=current_since, limit=1000)
+    if not probe:
+        return []
+    kept_pages.append(_dedupe_page(seen_keys, probe))
+    total_kept += len(kept_pages[-1])
+    current_since = probe[-1]['timestamp'] + 1
+    if len(probe) >= 1000:
+        stride = max(probe[-1]['timestamp'] - probe[0]['timestamp'], 1)
+
+        done = False
+        while not done and current_since < end_ms:
+            window_starts = [current_since + i * stride for i in range(FETCH_CONCURRENCY)
+                             if current_since + i * stride < end_ms]
+            pages = await asyncio.gather(
+                *[_fetch_window(exchange, pair, s, semaphore) for s in window_starts])
 
+            for window_start, page in zip(window_starts, pages):
+                if not page:
+                    done = True
+                    break
+                kept_pages.append(_dedupe_page(seen_keys, page))
+                total_kept += len(kept_pages[-1])
+                last_ts = page[-1]['timestamp']
+                if len(page) < 1000:
+                    # Reached the present; nothing beyond this page
+                    done = True
+                    break
+                if last_ts + 1 < window_start + stride:
+                    # Page did not cover its window: trades arrived faster than
+                    # estimated. Rewind past this page and shrink the stride.
+                    stride = max(last_ts - window_start, 1)
+                    current_since = last_ts + 1
+                    break
+                current_since = last_ts + 1
 
-def benford_law_test(trades):
+            print(f"  Fetched {total_kept} trades...", end='\r')
+
+    all_trades = list(itertools.chain.from_iterable(kept_pages))
+    all_trades.sort(key=lambda t: t['timestamp'])
+    return all_trades
+
+
+def fetch_market_data(exchange, pair, days=30):
+    """
+    Fetch trades, ticker, and order book over one shared exchange session.
+
+    Instantiating an exchange per call costs a markets load plus TLS setup
+    each time; a single instance keeps the HTTP session warm across all
+    three CCXT calls.
+
+    Args:
+        exchange: ccxt.async_support exchange instance
+        pair: Trading pair (e.g., 'BTC/USDT')
+        days: Number of days of historical data to fetch
+
+    Returns:
+        tuple: (trades, ticker, order_book); ticker and order_book are None
+               if the order book endpoints were unavailable
+    """
+    print(f"Fetching {days} days of trades from {exchange.id} for {pair}...")
+
+    async def _run():
+        try:
+            trades = await _fetch_trades_async(exchange, pair, days)
+            try:
+                ticker = await exchange.fetch_ticker(pair)
+                order_book = await exchange.fetch_order_book(pair, limit=20)
+            except Exception as e:
+                print(f"\nWarning: Could not fetch order book data: {e}")
+                ticker, order_book = None, None
+            return trades, ticker, order_book
+        finally:
+            await exchange.close()
+
+    trades, ticker, order_book = asyncio.run(_run())
+
+    print(f"\nTotal trades fetched: {len(trades)}")
+    return trades, ticker, order_book
+
+
+def benford_law_test(amounts):
     """
     Apply Benford's Law to detect wash trading.
-    
+
     Benford's Law (Nigrini, 1999): Natural numerical data follows a logarithmic distribution
     of first digits. Manipulated data (wash trading) deviates from this pattern.
-    
+
     Expected first digit distribution: P(d) = log10(1 + 1/d) for d in [1,9]
-    
+
     Args:
-        trades: List of trade dictionaries
-    
+        amounts: float64 array of trade amounts
+
     Returns:
         dict: chi_squared, p_value, result (PASS/FAIL)
     """
-    # Extract first digits from trade amounts
-    amounts = [float(t['amount']) for t in trades if float(t['amount']) > 0]
-    first_digits = [int(str(float(amt)).lstrip('0.')[0]) for amt in amounts if amt > 0]
-    first_digits = [d for d in first_digits if 1 <= d <= 9]
-    
-    if not first_digits:
+    # Extract first digits (vectorized: one log10 pass in C instead of a
+    # per-trade str() round-trip)
+    amounts = amounts[amounts > 0]
+
+    if amounts.size == 0:
         return {"chi_squared": 0, "p_value": 1.0, "result": "INSUFFICIENT_DATA"}
-    
-    # Count observed frequencies
-    observed = Counter(first_digits)
-    observed_freq = [observed.get(d, 0) for d in range(1, 10)]
-    
-    # Benford's Law expected frequencies
-    expected_freq = [len(first_digits) * np.log10(1 + 1/d) for d in range(1, 10)]
-    
+
+    first_digits = (amounts * 10.0 ** (-np.floor(np.log10(amounts)))).astype(np.int8)
+    first_digits = first_digits[(first_digits >= 1) & (first_digits <= 9)]
+
+    if first_digits.size == 0:
+        return {"chi_squared": 0, "p_value": 1.0, "result": "INSUFFICIENT_DATA"}
+
     # Chi-squared test
     # Reference: Hill, T. P. (1995). Statistical Science, Vol. 10, No. 4
-    chi_squared, p_value = stats.chisquare(observed_freq, expected_freq)
+    if HAVE_NUMBA:
+        chi_squared = _benford_chi2(first_digits)
+        p_value = stats.chi2.sf(chi_squared, df=8)
+    else:
+        # Count observed frequencies: one C pass with direct indexing,
+        # no per-digit hashing
+        observed_freq = np.bincount(first_digits, minlength=10)[1:10]
+
+        # Benford's Law expected frequencies
+        expected_freq = first_digits.size * _BENFORD_P
+
+        # Compute the statistic directly and take the survival function once;
+        # stats.chisquare adds argument validation and normalization we don't need
+        chi_squared = float(((observed_freq - expected_freq) ** 2 / expected_freq).sum())
+        p_value = stats.chi2.sf(chi_squared, df=8)
     
     # p < 0.05 indicates significant deviation from Benford's Law (likely manipulation)
     result = "FAIL" if p_value < 0.05 else "PASS"
@@ -118,24 +314,25 @@ def benford_law_test(trades):
     }
 
 
-def buy_sell_symmetry_test(trades):
+def buy_sell_symmetry_test(sides):
     """
     Test for buy/sell order symmetry.
-    
+
     Reference: Cong et al. (2022). "Crypto Wash Trading." Yale/NBER Working Paper.
     Natural markets show ~50/50 buy/sell ratio. Wash trading often creates asymmetry
     as bots place matched orders with timing delays.
-    
+
     Acceptable range: 45-55% for either side.
-    
+
     Args:
-        trades: List of trade dictionaries
-    
+        sides: array of trade sides ('buy'/'sell')
+
     Returns:
         dict: buy_pct, sell_pct, result (PASS/FAIL)
     """
-    buy_count = sum(1 for t in trades if t.get('side') == 'buy')
-    sell_count = sum(1 for t in trades if t.get('side') == 'sell')
+    # Counting happens in C reductions over the side column
+    buy_count = int((sides == 'buy').sum())
+    sell_count = int((sides == 'sell').sum())
     total = buy_count + sell_count
     
     if total == 0:
@@ -154,61 +351,57 @@ def buy_sell_symmetry_test(trades):
     }
 
 
-def volume_depth_ratio_test(exchange_name, pair):
+def volume_depth_ratio_test(ticker, order_book):
     """
     Compare reported volume to order book depth.
-    
+
     Wash trading inflates volume without corresponding order book depth.
     Healthy exchanges: ratio ~3-5x. Suspicious: ratio >10x.
-    
+
     Benchmark: Kaiko Research (2021). "Exchange Data Quality Metrics."
-    
+
     Args:
-        exchange_name: Exchange identifier
-        pair: Trading pair
-    
+        ticker: Ticker dict from fetch_market_data (None if unavailable)
+        order_book: Order book dict from fetch_market_data (None if unavailable)
+
     Returns:
         dict: ratio, benchmark, result (PASS/WARNING/FAIL)
     """
-    try:
-        exchange_class = getattr(ccxt, exchange_name)
-        exchange = exchange_class({'enableRateLimit': True})
-        
-        # Get 24h volume
-        ticker = exchange.fetch_ticker(pair)
-        volume_24h = float(ticker.get('quoteVolume', 0))
-        
-        # Get order book depth (sum of top 20 levels)
-        order_book = exchange.fetch_order_book(pair, limit=20)
-        bid_depth = sum([bid[1] * bid[0] for bid in order_book['bids']])
-        ask_depth = sum([ask[1] * ask[0] for ask in order_book['asks']])
-        total_depth = bid_depth + ask_depth
-        
-        if total_depth == 0:
-            return {"ratio": 0, "benchmark": "3-5x", "result": "INSUFFICIENT_DATA"}
-        
-        ratio = volume_24h / total_depth
-        
-        # Classify based on ratio
-        if ratio < 3:
-            result = "PASS"  # Low volume relative to depth (good liquidity)
-        elif 3 <= ratio <= 10:
-            result = "PASS"  # Normal range
-        elif 10 < ratio <= 20:
-            result = "WARNING"  # Elevated, needs investigation
-        else:
-            result = "FAIL"  # Volume inflation likely
-        
-        return {
-            "ratio": float(ratio),
-            "benchmark": "3-5x",
-            "result": result
-        }
-        
-    except Exception as e:
-        print(f"Warning: Could not fetch order book data: {e}")
+    if ticker is None or order_book is None:
         return {"ratio": 0, "benchmark": "3-5x", "result": "ERROR"}
 
+    # 24h volume
+    volume_24h = float(ticker.get('quoteVolume', 0))
+
+    # Order book depth (sum of top 20 levels), vectorized so deeper books
+    # (limit=100+) don't materialize a Python list per side
+    bids = np.asarray(order_book['bids'], dtype=np.float64)
+    asks = np.asarray(order_book['asks'], dtype=np.float64)
+    bid_depth = float((bids[:, 0] * bids[:, 1]).sum()) if bids.size else 0.0
+    ask_depth = float((asks[:, 0] * asks[:, 1]).sum()) if asks.size else 0.0
+    total_depth = bid_depth + ask_depth
+
+    if total_depth == 0:
+        return {"ratio": 0, "benchmark": "3-5x", "result": "INSUFFICIENT_DATA"}
+
+    ratio = volume_24h / total_depth
+
+    # Classify based on ratio
+    if ratio < 3:
+        result = "PASS"  # Low volume relative to depth (good liquidity)
+    elif 3 <= ratio <= 10:
+        result = "PASS"  # Normal range
+    elif 10 < ratio <= 20:
+        result = "WARNING"  # Elevated, needs investigation
+    else:
+        result = "FAIL"  # Volume inflation likely
+
+    return {
+        "ratio": float(ratio),
+        "benchmark": "3-5x",
+        "result": result
+    }
+
 
 def calculate_manipulation_probability(benford, symmetry, volume_depth):
     """
@@ -286,10 +479,15 @@ def fetch_algohouse_score(exchange_name):
         float: Quality score 0-1, or None if unavailable
     """
     try:
-        # AlgoHouse public API endpoint
-        response = requests.get('https://api.algohouse.ai/exchanges', timeout=10)
-        data = response.json()
-        
+        # AlgoHouse public API endpoint (response cached with a short TTL)
+        now = time.monotonic()
+        if (_algohouse_cache['data'] is None
+                or now - _algohouse_cache['fetched_at'] > _ALGOHOUSE_TTL_SECONDS):
+            response = _SESSION.get('https://api.algohouse.ai/exchanges', timeout=10)
+            _algohouse_cache['data'] = response.json()
+            _algohouse_cache['fetched_at'] = now
+        data = _algohouse_cache['data']
+
         # Find matching exchange
         for exchange in data:
             if exchange.get('exchange_code', '').lower() == exchange_name.lower():
@@ -323,74 +521,104 @@ def calculate_score_correlation(manipulation_prob, algohouse_score):
     return -1.0 * (manipulation_prob - (1 - algohouse_score))
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description='Detect wash trading on cryptocurrency exchanges',
-        epilog='Academic references: Nigrini (1999), Cong et al. (2022), Hill (1995)'
-    )
-    parser.add_argument('--exchange', required=True, help='Exchange name (e.g., binance, kraken)')
-    parser.add_argument('--pair', required=True, help='Trading pair (e.g., BTC/USDT)')
-    parser.add_argument('--days', type=int, default=30, help='Days of historical data (default: 30)')
-    parser.add_argument('--output', required=True, help='Output JSON file path')
-    parser.add_argument('--compare-algohouse', action='store_true', 
-                        help='Compare results with AlgoHouse quality scores')
-    
-    args = parser.parse_args()
-    
-    print(f"\n{'='*70}")
-    print(f"Wash Trading Detector")
-    print(f"{'='*70}\n")
-    print(f"Exchange: {args.exchange}")
-    print(f"Pair: {args.pair}")
-    print(f"Period: {args.days} days")
-    print(f"Output: {args.output}\n")
-    
-    # Step 1: Fetch trade data
-    trades = fetch_trades(args.exchange, args.pair, args.days)
-    
+def write_report(path, report):
+    """
+    Serialize the report with orjson and write it straight to the file
+    descriptor.
+
+    orjson hands back the full payload as one bytes object, so routing it
+    through Python's buffered-IO layer only adds a copy; write the buffer
+    directly with os.write instead.
+
+    Args:
+        path: Output file path
+        report: JSON-serializable report dict
+    """
+    payload = orjson.dumps(
+        report,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def run_one(exchange_name, pair, days=30, compare_algohouse=False):
+    """
+    Run the full detection pipeline for one exchange.
+
+    Args:
+        exchange_name: Exchange identifier (e.g., 'binance', 'kraken')
+        pair: Trading pair (e.g., 'BTC/USDT')
+        days: Days of historical data to analyze
+        compare_algohouse: Also fetch the AlgoHouse quality score
+
+    Returns:
+        dict: Full analysis report
+
+    Raises:
+        RuntimeError: If too few trades are available for the statistics
+    """
+    # Step 1: Fetch all market data over one exchange instance
+    exchange = get_exchange_class(exchange_name)({
+        'enableRateLimit': True,
+        'timeout': 30000,
+    })
+    trades, ticker, order_book = fetch_market_data(exchange, pair, days)
+
     if len(trades) < 100:
-        print(f"Error: Insufficient data ({len(trades)} trades). Need at least 100 trades for statistical significance.")
-        sys.exit(1)
-    
+        raise RuntimeError(
+            f"Insufficient data ({len(trades)} trades). "
+            "Need at least 100 trades for statistical significance.")
+
     # Step 2: Run detection heuristics
     print("\nRunning detection tests...")
-    
-    benford = benford_law_test(trades)
+
+    # Columnar view of the trades: a single Python-level pass extracts every
+    # column, so each test works on a contiguous array instead of re-walking
+    # the list of dicts
+    df = pd.DataFrame(trades, columns=['timestamp', 'amount', 'side'])
+
+    benford = benford_law_test(df['amount'].to_numpy(dtype=np.float64))
     print(f"  Benford's Law: {benford['result']} (p={benford['p_value']:.4f})")
-    
-    symmetry = buy_sell_symmetry_test(trades)
+
+    symmetry = buy_sell_symmetry_test(df['side'].to_numpy())
     print(f"  Buy/Sell Symmetry: {symmetry['result']} ({symmetry['buy_pct']:.1f}% buy, {symmetry['sell_pct']:.1f}% sell)")
-    
-    volume_depth = volume_depth_ratio_test(args.exchange, args.pair)
+
+    volume_depth = volume_depth_ratio_test(ticker, order_book)
     print(f"  Volume/Depth Ratio: {volume_depth['result']} (ratio={volume_depth['ratio']:.2f}x)")
-    
+
     # Step 3: Calculate manipulation probability
     manipulation_prob = calculate_manipulation_probability(benford, symmetry, volume_depth)
     manipulation_label = get_manipulation_label(manipulation_prob)
-    
+
     print(f"\nManipulation Probability: {manipulation_prob:.2%} ({manipulation_label})")
-    
+
     # Step 4: Optional AlgoHouse comparison
     algohouse_score = None
     score_correlation = None
-    
-    if args.compare_algohouse:
+
+    if compare_algohouse:
         print("\nFetching AlgoHouse quality score...")
-        algohouse_score = fetch_algohouse_score(args.exchange)
+        algohouse_score = fetch_algohouse_score(exchange_name)
         if algohouse_score is not None:
             print(f"  AlgoHouse Credibility Score: {algohouse_score:.2f}")
             score_correlation = calculate_score_correlation(manipulation_prob, algohouse_score)
             print(f"  Score Correlation: {score_correlation:.3f}")
         else:
             print("  AlgoHouse score not available for this exchange")
-    
+
     # Step 5: Build output report
-    report = {
-        "exchange": args.exchange,
-        "pair": args.pair,
-        "period_days": args.days,
+    return {
+        "exchange": exchange_name,
+        "pair": pair,
+        "period_days": days,
         "total_trades_analyzed": len(trades),
-        "analysis_timestamp": datetime.now().isoformat(),
+        "analysis_timestamp": datetime.now(),
         "benfords_law": benford,
         "buy_sell_symmetry": symmetry,
         "volume_depth_ratio": volume_depth,
@@ -399,11 +627,79 @@ def main():
         "algohouse_quality_score": algohouse_score,
         "score_correlation": score_correlation
     }
-    
-    # Step 6: Save to JSON
-    with open(args.output, 'w') as f:
-        json.dump(report, f, indent=2)
-    
+
+
+def run_many(exchanges, pair, days=30, compare_algohouse=False):
+    """
+    Run the detection pipeline across several exchanges concurrently.
+
+    The per-exchange pipeline is dominated by CCXT network I/O, so a thread
+    pool overlaps the latency; the numpy statistics release the GIL, and
+    each thread drives its own asyncio loop for pagination.
+
+    Args:
+        exchanges: List of exchange identifiers
+        pair: Trading pair (e.g., 'BTC/USDT')
+        days: Days of historical data to analyze
+        compare_algohouse: Also fetch AlgoHouse quality scores
+
+    Returns:
+        dict: Exchange name -> report dict; failed exchanges map to a dict
+              with an 'error' entry
+    """
+    reports = {}
+    with ThreadPoolExecutor(max_workers=min(8, len(exchanges))) as executor:
+        futures = {
+            executor.submit(run_one, name, pair, days, compare_algohouse): name
+            for name in exchanges
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                reports[name] = future.result()
+            except Exception as e:
+                print(f"Error analyzing {name}: {e}")
+                reports[name] = {"exchange": name, "error": str(e)}
+    return reports
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Detect wash trading on cryptocurrency exchanges',
+        epilog='Academic references: Nigrini (1999), Cong et al. (2022), Hill (1995)'
+    )
+    parser.add_argument('--exchange', required=True,
+                        help='Exchange name, or comma-separated list (e.g., binance,kraken)')
+    parser.add_argument('--pair', required=True, help='Trading pair (e.g., BTC/USDT)')
+    parser.add_argument('--days', type=int, default=30, help='Days of historical data (default: 30)')
+    parser.add_argument('--output', required=True, help='Output JSON file path')
+    parser.add_argument('--compare-algohouse', action='store_true',
+                        help='Compare results with AlgoHouse quality scores')
+
+    args = parser.parse_args()
+    exchanges = [name.strip() for name in args.exchange.split(',') if name.strip()]
+
+    print(f"\n{'='*70}")
+    print(f"Wash Trading Detector")
+    print(f"{'='*70}\n")
+    print(f"Exchange: {', '.join(exchanges)}")
+    print(f"Pair: {args.pair}")
+    print(f"Period: {args.days} days")
+    print(f"Output: {args.output}\n")
+
+    if len(exchanges) == 1:
+        try:
+            report = run_one(exchanges[0], args.pair, args.days, args.compare_algohouse)
+        except Exception as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+    else:
+        report = run_many(exchanges, args.pair, args.days, args.compare_algohouse)
+
+    # Save to JSON
+    # orjson serializes datetime and numpy scalars natively, ~5-6x faster than stdlib json
+    write_report(args.output, report)
+
     print(f"\nReport saved to: {args.output}")
     print(f"\n{'='*70}\n")
 